@@ -1,12 +1,41 @@
 import argparse
+import atexit
 import json
 import logging
+import logging.handlers
+import queue
+import socket
+import ssl
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from urllib.parse import urlparse
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from urllib.parse import unquote, urlencode, urlparse
 
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # Optional: orjson decodes large conf listings several times faster
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+# (connect, read) seconds for every REST call
+TIMEOUT = (5, 60)
+
+# (connect, read) seconds for SHC member warm-up requests, which are best-effort
+WARMUP_TIMEOUT = (2, 5)
+
+# Per-host connection pools kept by a session: the push target plus SHC members
+POOL_HOSTS = 16
+
+# Replaces urllib3's defaults, so TCP_NODELAY (its only default) is kept:
+# the form POSTs are small and must not wait on Nagle's algorithm
+SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
 
 
 def setup_logging(log_file=None):
@@ -18,106 +47,336 @@ def setup_logging(log_file=None):
 
     console = logging.StreamHandler()
     console.setFormatter(formatter)
-    logger.addHandler(console)
+    handlers = [console]
 
     if log_file:
         file_handler = logging.FileHandler(log_file)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # Worker threads only enqueue records; one listener thread writes them to
+    # the console and file, so workers never wait on handler I/O locks
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, *handlers)
+    listener.start()
+    atexit.register(listener.stop)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
     return logger
 
 
+def create_ssl_context():
+    # Certificates are not verified (session.verify is False). Without an
+    # explicit context urllib3 builds a fresh one, and loads the system CA
+    # store into it, for every new connection; one shared context avoids that.
+    ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    ctx.check_hostname = False
+    ctx.verify_mode = ssl.CERT_NONE
+    return ctx
+
+
+class SplunkHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies SOCKET_OPTIONS and a shared SSL context to
+    every pooled connection."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault("socket_options", SOCKET_OPTIONS)
+        kwargs.setdefault("ssl_context", create_ssl_context())
+        super().init_poolmanager(*args, **kwargs)
+
+
+class SplunkRetry(Retry):
+    """Retry that only repeats a POST on 502/503.
+
+    Those mean splunkd never handled the request. After a 500 or 504 the
+    change may already be applied, and re-POSTing a create would then fail
+    with 409 for a stanza that exists. GETs retry on every listed status.
+    """
+
+    POST_STATUS_FORCELIST = frozenset([502, 503])
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if method.upper() == "POST" and status_code not in self.POST_STATUS_FORCELIST:
+            return False
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+def mount_adapter(session, pool_size=10, hosts=POOL_HOSTS):
+    # pool_connections is the number of per-host pools kept; pool_maxsize is
+    # the number of keep-alive connections per host. Leave headroom above the
+    # worker count so bursts reuse connections instead of discarding them.
+    adapter = SplunkHTTPAdapter(
+        pool_connections=hosts,
+        pool_maxsize=max(pool_size * 2, 32),
+        pool_block=False,
+        # Read errors are not retried, and POSTs only on 502/503 (see
+        # SplunkRetry): in both cases the POST may already have been applied
+        max_retries=SplunkRetry(
+            total=3,
+            connect=3,
+            read=0,
+            backoff_factor=0.5,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "POST"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        ),
+    )
+    # Close the adapter being replaced so its pooled sockets are released
+    session.get_adapter("https://").close()
+    session.mount("https://", adapter)
+
+
+class SplunkSession(requests.Session):
+    """Session that reads proxy settings from the environment once per origin.
+
+    With trust_env enabled, requests re-reads ~/.netrc, the proxy variables
+    and the CA bundle variables on every call. This session disables that
+    and instead caches get_environ_proxies() for each scheme://host:port, so
+    HTTPS_PROXY and NO_PROXY still apply to every host it talks to (including
+    each SHC member).
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.trust_env = False
+        self._environ_proxies = {}
+
+    def merge_environment_settings(self, url, proxies, stream, verify, cert):
+        origin = "/".join(url.split("/", 3)[:3])
+        env_proxies = self._environ_proxies.get(origin)
+        if env_proxies is None:
+            env_proxies = requests.utils.get_environ_proxies(origin)
+            self._environ_proxies[origin] = env_proxies
+        proxies = {**env_proxies, **(proxies or {})}
+        return super().merge_environment_settings(url, proxies, stream, verify, cert)
+
+
 def create_session(token, pool_size=10):
-    session = requests.Session()
+    session = SplunkSession()
     session.headers.update({
         "Authorization": f"Bearer {token}",
         "Content-Type": "application/x-www-form-urlencoded",
     })
     session.verify = False
 
-    adapter = HTTPAdapter(
-        pool_connections=pool_size,
-        pool_maxsize=pool_size,
-    )
-    session.mount("https://", adapter)
+    mount_adapter(session, pool_size)
     return session
 
 
+class NoRetryAdapter(HTTPAdapter):
+    """Adapter that sends without retries through another adapter's pools.
+
+    Connections it opens or reuses belong to the shared adapter's pools, so
+    closing the shared adapter also closes them. Never mount or close this one.
+    """
+
+    def __init__(self, shared):
+        self._shared = shared
+        super().__init__(max_retries=0)
+
+    def init_poolmanager(self, *args, **kwargs):
+        self.poolmanager = self._shared.poolmanager
+        self.proxy_manager = self._shared.proxy_manager
+
+
+def _get_once(session, adapter, url, timeout):
+    """GET url through adapter with the session's headers and proxies."""
+    request = session.prepare_request(requests.Request("GET", url))
+    settings = session.merge_environment_settings(url, {}, None, None, None)
+    response = adapter.send(request, timeout=timeout, **settings)
+    # Read the body now, as Session.send does, so the connection is released
+    # back to the pool instead of being held by the response
+    _ = response.content
+    return response
+
+
+def _run_pool(fn, jobs, workers):
+    """Run fn(*job) for each job on a thread pool.
+
+    Yields (job, result, error) tuples as each job finishes; error is the
+    exception raised by fn, or None. Jobs are submitted through a sliding
+    window of workers * 2, so the number of queued futures stays bounded
+    however many jobs there are.
+    """
+    pending = {}
+
+    def _drain(done):
+        for future in done:
+            job = pending.pop(future)
+            try:
+                yield job, future.result(), None
+            except Exception as e:
+                yield job, None, e
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for job in jobs:
+            if len(pending) >= workers * 2:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                yield from _drain(done)
+            pending[executor.submit(fn, *job)] = job
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            yield from _drain(done)
+
+
+def _error_body(response, limit=512):
+    """Return at most limit bytes of a response body for logging."""
+    return response.content[:limit].decode("utf-8", "replace")
+
+
+def _prepare_item(item, conf_type):
+    """Cache request paths, the encoded body and expected values on item.
+
+    These depend only on the item, so they are computed once here rather
+    than on every push attempt and for every SHC member during validation.
+    Both paths are None when the item has no id and no conf_type is given.
+    Expected values are stringified for the SHC drift comparison.
+    """
+    item_id = item.get("id")
+    if item_id:
+        # ids from | rest are plain https://host:port/path URLs; slice the
+        # path off directly and only fall back to urlparse for anything else
+        parts = item_id.split("/", 3)
+        if (len(parts) == 4 and item_id.startswith(("https://", "http://"))
+                and "?" not in parts[3] and "#" not in parts[3]):
+            path = "/" + parts[3]
+        else:
+            path = urlparse(item_id).path
+        base = path.rsplit("/", 1)[0]
+    elif conf_type:
+        base = f"/servicesNS/nobody/{item.get('app', 'search')}/configs/conf-{conf_type}"
+        path = f"{base}/{item.get('title')}"
+    else:
+        path = base = None
+
+    configs = item.get("configs") or {}
+    expected = {k: str(v) for k, v in configs.items()}
+    encoded_body = urlencode(
+        {k: v for k, v in configs.items() if v is not None}, doseq=True
+    ).encode()
+
+    # Assigned together so a failure above leaves the item unprepared
+    item["_path"] = path
+    item["_base"] = base
+    item["_expected"] = expected
+    item["_encoded_body"] = encoded_body
+    return item
+
+
 def post_splunk_changes(session, host, port, conf_type, data_file,
                         update_only=False, test_run=None, workers=8,
-                        log_file=None):
-    log = setup_logging(log_file)
+                        log_file=None, timeout=TIMEOUT, log=None):
+    log = log or setup_logging(log_file)
 
     try:
-        with open(data_file, 'r') as f:
-            change_list = json.load(f)
+        with open(data_file, 'rb') as f:
+            change_list = json_loads(f.read())
     except Exception as e:
         log.error(f"Error reading JSON file: {e}")
         return None
 
     log.info(f"Loaded {len(change_list)} stanza(s) from {data_file}")
 
+    # Drop exact duplicates (common when change files are concatenated)
+    seen = set()
+    unique = []
+    for item in change_list:
+        key = json.dumps([item.get("id"), item.get("app", "search"),
+                          item.get("title"), item.get("configs", {})],
+                         sort_keys=True)
+        if key not in seen:
+            seen.add(key)
+            unique.append(item)
+    if len(unique) < len(change_list):
+        log.info(f"Dropped {len(change_list) - len(unique)} duplicate stanza(s)")
+        change_list = unique
+
     if test_run is not None:
         log.info(f"--test-run {test_run}: processing first {test_run} of {len(change_list)} stanza(s)")
         change_list = change_list[:test_run]
 
+    # Push stanzas for the same app together so splunkd's per-app caches stay warm
+    # Keys are stringified: app/title may be null or non-string in the file
+    change_list.sort(key=lambda it: (str(it.get("app") or "search"),
+                                     str(it.get("title") or "")))
+
     log.info(f"Target: https://{host}:{port} | conf-type: {conf_type or 'N/A (post-by-id)'} | update-only: {update_only} | workers: {workers}")
 
+    # Pre-flight — one authenticated request before starting the pool, so a bad
+    # token or unreachable host aborts the run instead of failing every item.
+    # It also leaves a warm connection in the pool for the first workers.
+    preflight_url = f"https://{host}:{port}/services/authentication/current-context?output_mode=json"
+    try:
+        resp = session.get(preflight_url, timeout=timeout)
+    except requests.RequestException as e:
+        log.error(f"Pre-flight: failed to reach https://{host}:{port}: {e}")
+        return None
+
+    if resp.status_code in (401, 403):
+        log.error(f"Pre-flight: authentication failed (HTTP {resp.status_code}). "
+                  f"Check --token. Aborting.")
+        return None
+
+    origin = f"https://{host}:{port}"
+    # Checked once per run so per-item INFO lines cost nothing when filtered
+    verbose = log.isEnabledFor(logging.INFO)
+    # An expired token fails every item the same way; log its body only once
+    auth_failure_logged = threading.Event()
+
     def _push_one(item):
         title = item.get("title")
         app = item.get("app", "search")
-        configs = item.get("configs", {})
-        item_id = item.get("id")
-
-        if item_id:
-            parsed_id = urlparse(item_id)
-            stanza_url = f"https://{host}:{port}{parsed_id.path}"
-            base_url = f"https://{host}:{port}{parsed_id.path.rsplit('/', 1)[0]}"
-        elif conf_type:
-            base_url = f"https://{host}:{port}/servicesNS/nobody/{app}/configs/conf-{conf_type}"
-            stanza_url = f"{base_url}/{title}"
-        else:
-            log.error(f"Stanza '{title}' has no id and --type was not provided. Skipping.")
+        # Prepared here so a malformed item fails on its own, like any other
+        # per-item error, and the first POST doesn't wait for the whole list
+        _prepare_item(item, conf_type)
+
+        if item["_path"] is None:
+            log.error("Stanza '%s' has no id and --type was not provided. Skipping.", title)
             return "failed"
 
-        log.info(f"Processing [{title}] in app={app}")
+        if verbose:
+            log.info("Processing [%s] in app=%s", title, app)
 
-        response = session.post(stanza_url, data=configs)
+        response = session.post(origin + item["_path"],
+                                data=item["_encoded_body"], timeout=timeout)
 
         if response.status_code == 404:
             if update_only:
-                log.warning(f"Stanza '{title}' not found. Skipping (--update-only).")
+                log.warning("Stanza '%s' not found. Skipping (--update-only).", title)
                 return "skipped"
-            log.info(f"Stanza '{title}' not found. Attempting to create...")
-            create_payload = {**configs, "name": title}
-            response = session.post(base_url, data=create_payload)
+            log.info("Stanza '%s' not found. Attempting to create...", title)
+            create_payload = {**(item.get("configs") or {}), "name": title}
+            response = session.post(origin + item["_base"],
+                                    data=create_payload, timeout=timeout)
 
         if response.status_code in [200, 201]:
-            log.info(f"Successfully applied changes to {title}.")
+            if verbose:
+                log.info("Successfully applied changes to %s.", title)
             return "success"
         else:
-            log.error(f"Failed {title}. Status: {response.status_code}, Body: {response.text}")
+            if response.status_code in (401, 403):
+                if auth_failure_logged.is_set():
+                    log.error("Failed %s. Status: %s", title, response.status_code)
+                    return "failed"
+                auth_failure_logged.set()
+            log.error("Failed %s. Status: %s, Body: %s",
+                      title, response.status_code, _error_body(response))
             return "failed"
 
     success, failed, skipped = 0, 0, 0
 
-    with ThreadPoolExecutor(max_workers=workers) as executor:
-        futures = {executor.submit(_push_one, item): item for item in change_list}
-        for future in as_completed(futures):
-            item = futures[future]
-            try:
-                result = future.result()
-            except Exception as e:
-                log.error(f"Unexpected error processing '{item.get('title', '?')}': {e}")
-                failed += 1
-                continue
-            if result == "success":
-                success += 1
-            elif result == "failed":
-                failed += 1
-            elif result == "skipped":
-                skipped += 1
+    jobs = ((item,) for item in change_list)
+    for (item,), result, error in _run_pool(_push_one, jobs, workers):
+        if error is not None:
+            log.error("Unexpected error processing '%s': %s", item.get("title", "?"), error)
+            failed += 1
+        elif result == "success":
+            success += 1
+        elif result == "failed":
+            failed += 1
+        elif result == "skipped":
+            skipped += 1
 
     log.info(f"Complete: {success} succeeded, {failed} failed, {skipped} skipped")
 
@@ -125,24 +384,34 @@ def post_splunk_changes(session, host, port, conf_type, data_file,
 
 
 def validate_shc(session, host, port, conf_type, change_list,
-                 delay=5, workers=8, log_file=None):
-    log = setup_logging(log_file)
+                 delay=5, workers=8, log_file=None, timeout=TIMEOUT, log=None):
+    log = log or setup_logging(log_file)
 
-    # Step A — Get captain info & verify health
+    # Captain health and member discovery are independent; request both at once
     log.info("SHC Validation: checking captain health...")
     captain_url = f"https://{host}:{port}/services/shcluster/captain/info?output_mode=json"
+    members_url = f"https://{host}:{port}/services/shcluster/captain/members?output_mode=json"
+    # Sent without retries: a 503 here means "not an SHC member" and should
+    # skip validation at once, not after the retry policy's backoff
+    no_retry = NoRetryAdapter(session.get_adapter("https://"))
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        captain_future = executor.submit(_get_once, session, no_retry, captain_url, timeout)
+        members_future = executor.submit(_get_once, session, no_retry, members_url, timeout)
+        wait([captain_future, members_future])
+
+    # Step A — Verify captain health
     try:
-        resp = session.get(captain_url)
+        resp = captain_future.result()
         if resp.status_code in (404, 503):
             log.warning("SHC Validation: this host does not appear to be an SHC member. Skipping validation.")
-            log.info(f"Captain info returned HTTP {resp.status_code}: {resp.text}")
+            log.info(f"Captain info returned HTTP {resp.status_code}: {_error_body(resp)}")
             return
         resp.raise_for_status()
     except requests.RequestException as e:
         log.error(f"SHC Validation: failed to reach captain info endpoint: {e}")
         return
 
-    captain_info = resp.json()["entry"][0]["content"]
+    captain_info = json_loads(resp.content)["entry"][0]["content"]
     if str(captain_info.get("service_ready_flag")) != "1":
         log.error("SHC Validation: cluster is not ready (service_ready_flag != 1). Aborting.")
         return
@@ -151,16 +420,15 @@ def validate_shc(session, host, port, conf_type, change_list,
     log.info(f"SHC Validation: captain '{captain_label}' is healthy (service_ready_flag=1)")
 
     # Step B — Discover members
-    members_url = f"https://{host}:{port}/services/shcluster/captain/members?output_mode=json"
     try:
-        resp = session.get(members_url)
+        resp = members_future.result()
         resp.raise_for_status()
     except requests.RequestException as e:
         log.error(f"SHC Validation: failed to discover members: {e}")
         return
 
     members = []
-    for entry in resp.json().get("entry", []):
+    for entry in json_loads(resp.content).get("entry", []):
         content = entry.get("content", {})
         mgmt_uri = content.get("management_uri", "")
         label = content.get("label", entry.get("name", "unknown"))
@@ -179,74 +447,124 @@ def validate_shc(session, host, port, conf_type, change_list,
     log.info(f"SHC Validation: discovered {len(members)} member(s): "
              + ", ".join(m["label"] for m in members))
 
-    # Wait for replication
+    # Each member is a separate host. Only rebuild the pools (dropping warm
+    # connections) when the cluster has more members than the session holds.
+    if len(members) > POOL_HOSTS:
+        mount_adapter(session, workers, hosts=len(members))
+        no_retry = NoRetryAdapter(session.get_adapter("https://"))
+
+    # Wait for replication, opening a connection to each member in the
+    # meantime so validation starts without TCP/TLS handshakes. Warm-ups skip
+    # the retry policy and are not waited on: a slow member must not hold back
+    # the others, and validation reports unreachable members itself.
     log.info(f"SHC Validation: waiting {delay}s for knowledge bundle replication...")
+    executor = ThreadPoolExecutor(max_workers=min(workers, len(members)))
+    for m in members:
+        executor.submit(_get_once, session, no_retry,
+                        f"https://{m['host']}:{m['port']}/services/server/info?output_mode=json",
+                        WARMUP_TIMEOUT)
     time.sleep(delay)
+    executor.shutdown(wait=False)
 
     # Step C — Validate configs on each member (threaded)
-    def _validate_one(item, member):
-        title = item.get("title")
-        app = item.get("app", "search")
-        configs = item.get("configs", {})
-        item_id = item.get("id")
-
-        if item_id:
-            parsed_id = urlparse(item_id)
-            stanza_url = (f"https://{member['host']}:{member['port']}"
-                          f"{parsed_id.path}?output_mode=json")
-        else:
-            stanza_url = (f"https://{member['host']}:{member['port']}"
-                          f"/servicesNS/nobody/{app}/configs/conf-{conf_type}"
-                          f"/{title}?output_mode=json")
-
+    # Group stanzas by their parent collection so each member is queried once
+    # per collection (e.g. conf-savedsearches in one app) instead of once per
+    # stanza.
+    passed = drift = missing = 0
+    groups = {}
+    for item in change_list:
         try:
-            resp = session.get(stanza_url)
-        except requests.RequestException as e:
-            log.error(f"  [{member['label']}] {title}: ERROR ({e})")
-            return "missing"
-
+            # Items pushed by post_splunk_changes are already prepared
+            if "_expected" not in item:
+                _prepare_item(item, conf_type)
+            if item.get("id"):
+                name = unquote(item["_path"].rsplit("/", 1)[1])
+            else:
+                name = item.get("title")
+        except Exception as e:
+            log.error("  %s: UNEXPECTED ERROR (%s)", item.get("title", "?"), e)
+            missing += len(members)
+            continue
+        groups.setdefault(item["_base"], []).append((name, item))
+
+    def _fetch_collection(member, collection):
+        url = f"https://{member['host']}:{member['port']}{collection}"
+        resp = session.get(url, params={"count": -1, "output_mode": "json"},
+                           timeout=timeout)
         if resp.status_code == 404:
-            log.warning(f"  [{member['label']}] {title}: MISSING")
-            return "missing"
+            return {}
+        resp.raise_for_status()
 
-        if resp.status_code != 200:
-            log.error(f"  [{member['label']}] {title}: ERROR (HTTP {resp.status_code})")
+        # Listings include stanzas shared from other apps; when a name is
+        # defined more than once, prefer the one owned by the target app
+        # (/servicesNS/<owner>/<app>/...; plain /services/... has none).
+        segments = collection.split("/")
+        app = segments[3] if len(segments) > 3 else None
+        remote = {}
+        for entry in json_loads(resp.content).get("entry", []):
+            name = entry.get("name")
+            if (name not in remote
+                    or (app and (entry.get("acl") or {}).get("app") == app)):
+                remote[name] = entry.get("content", {})
+        return remote
+
+    verbose = log.isEnabledFor(logging.INFO)
+
+    def _compare_one(item, member, remote):
+        title = item.get("title")
+        configs = item.get("configs") or {}
+
+        if remote is None:
+            log.warning("  [%s] %s: MISSING", member["label"], title)
             return "missing"
 
-        remote = resp.json()["entry"][0]["content"]
-        mismatched = []
-        for key, expected in configs.items():
-            actual = str(remote.get(key, ""))
-            if actual != str(expected):
-                mismatched.append(f"{key}: expected={expected!r}, got={actual!r}")
+        # Drift messages are only built for keys that actually differ
+        mismatched = [key for key, expected in item["_expected"].items()
+                      if str(remote.get(key, "")) != expected]
 
         if mismatched:
-            log.warning(f"  [{member['label']}] {title}: DRIFT")
-            for m in mismatched:
-                log.warning(f"    {m}")
+            log.warning("  [%s] %s: DRIFT", member["label"], title)
+            for key in mismatched:
+                log.warning("    %s: expected=%r, got=%r",
+                            key, configs[key], str(remote.get(key, "")))
             return "drift"
         else:
-            log.info(f"  [{member['label']}] {title}: PASS")
+            if verbose:
+                log.info("  [%s] %s: PASS", member["label"], title)
             return "passed"
 
-    check_pairs = [(item, member) for item in change_list for member in members]
-    total_checks = len(check_pairs)
-    passed = drift = missing = 0
+    def _validate_group(member, collection, stanzas):
+        try:
+            remote_stanzas = _fetch_collection(member, collection) if collection else {}
+        except requests.RequestException as e:
+            for _, item in stanzas:
+                log.error("  [%s] %s: ERROR (%s)", member["label"], item.get("title"), e)
+            return ["missing"] * len(stanzas)
 
-    with ThreadPoolExecutor(max_workers=workers) as executor:
-        futures = {
-            executor.submit(_validate_one, item, member): (item, member)
-            for item, member in check_pairs
-        }
-        for future in as_completed(futures):
-            item, member = futures[future]
+        # Compare stanzas individually so one bad item doesn't fail its group
+        results = []
+        for name, item in stanzas:
             try:
-                result = future.result()
+                results.append(_compare_one(item, member, remote_stanzas.get(name)))
             except Exception as e:
-                log.error(f"  [{member['label']}] {item.get('title', '?')}: "
-                          f"UNEXPECTED ERROR ({e})")
-                missing += 1
-                continue
+                log.error("  [%s] %s: UNEXPECTED ERROR (%s)",
+                          member["label"], item.get("title", "?"), e)
+                results.append("missing")
+        return results
+
+    fetch_jobs = [(member, collection, stanzas)
+                  for collection, stanzas in groups.items()
+                  for member in members]
+    total_checks = len(change_list) * len(members)
+
+    for (member, _, stanzas), results, error in _run_pool(_validate_group, fetch_jobs, workers):
+        if error is not None:
+            for _, item in stanzas:
+                log.error("  [%s] %s: UNEXPECTED ERROR (%s)",
+                          member["label"], item.get("title", "?"), error)
+            missing += len(stanzas)
+            continue
+        for result in results:
             if result == "passed":
                 passed += 1
             elif result == "drift":
@@ -284,6 +602,10 @@ if __name__ == "__main__":
         help="Only process the first N items (validates connectivity before full run)")
     parser.add_argument("--workers", type=int, default=8, metavar="N",
         help="Number of concurrent threads for push/validation (default: 8)")
+    parser.add_argument("--connect-timeout", type=float, default=TIMEOUT[0], metavar="SECONDS",
+        help=f"Seconds to wait for a connection to splunkd (default: {TIMEOUT[0]})")
+    parser.add_argument("--read-timeout", type=float, default=TIMEOUT[1], metavar="SECONDS",
+        help=f"Seconds to wait for a splunkd response (default: {TIMEOUT[1]})")
 
     args = parser.parse_args()
 
@@ -292,13 +614,18 @@ if __name__ == "__main__":
 
     requests.packages.urllib3.disable_warnings()
 
+    log = setup_logging(args.log)
+    timeout = (args.connect_timeout, args.read_timeout)
+
     session = create_session(args.token, pool_size=args.workers)
 
     change_list = post_splunk_changes(
         session, args.host, args.port, args.type, args.file,
-        args.update_only, args.test_run, args.workers, args.log
+        args.update_only, args.test_run, args.workers,
+        timeout=timeout, log=log
     )
 
     if args.shc and change_list:
         validate_shc(session, args.host, args.port, args.type,
-                     change_list, args.shc_delay, args.workers, args.log)
+                     change_list, args.shc_delay, args.workers,
+                     timeout=timeout, log=log)